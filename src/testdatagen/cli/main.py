@@ -40,6 +40,7 @@ from ..generator.strategies.random_strategy import RandomStrategy
 from ..generator.strategies.faker_strategy import FakerStrategy
 from ..export.formats.json_format import JsonExporter
 from ..export.formats.csv_format import CsvExporter
+from ..export.formats.parquet_format import ParquetExporter
 from ..export.database.postgresql import PostgreSQLExporter
 
 
@@ -112,7 +113,7 @@ def validate(schema_file, validate_only):
 @click.argument("schema_file", type=click.Path(exists=True, readable=True))
 @click.option("--count", "-c", default=100, help="Number of records to generate")
 @click.option("--output", "-o", default="output", help="Output directory")
-@click.option("--format", "-f", type=click.Choice(["json", "csv", "postgresql"]), default="json", help="Output format")
+@click.option("--format", "-f", type=click.Choice(["json", "csv", "parquet", "postgresql"]), default="json", help="Output format")
 @click.option("--strategy", "-s", type=click.Choice(["random", "faker"]), default="faker", help="Generation strategy")
 @click.option("--seed", type=int, help="Random seed for reproducible generation")
 @click.option("--locale", default="en_US", help="Locale for Faker strategy")
@@ -183,6 +184,9 @@ def generate(schema_file, count, output, format, strategy, seed, locale, pg_sche
     elif format == "csv":
         exporter = CsvExporter()
         file_extension = "csv"
+    elif format == "parquet":
+        exporter = ParquetExporter()
+        file_extension = "parquet"
     else:  # postgresql
         exporter = PostgreSQLExporter()
         file_extension = "sql"
@@ -26,11 +26,17 @@
 
 
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any, Union
 from abc import ABC, abstractmethod
 import pandas as pd
 
 
+# Size of the binary write buffer used by file exporters
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+
 class Exporter(ABC):
     """Base class for data exporters"""
     
@@ -46,6 +52,20 @@ class Exporter(ABC):
         """
         pass
     
+    def export_records(self, records: List[Dict[str, Any]], output_path: str, **options) -> None:
+        """
+        Export a list of row dictionaries to a file
+        
+        Exporters that can serialize rows directly override this; by default
+        the rows are converted to a DataFrame and passed to export.
+        
+        Args:
+            records: The rows to export
+            output_path: The path to write the output to
+            **options: Additional options for the exporter
+        """
+        self.export(pd.DataFrame.from_records(records), output_path, **options)
+    
     @abstractmethod
     def export_all(self, data: Dict[str, pd.DataFrame], output_dir: str, **options) -> Dict[str, str]:
         """
@@ -60,6 +80,48 @@ class Exporter(ABC):
             A dictionary of table names to output file paths
         """
         pass
+    
+    def _export_tables_concurrently(
+        self,
+        data: Dict[str, pd.DataFrame],
+        output_dir: str,
+        file_suffix: str,
+        options: Dict[str, Any]
+    ) -> Dict[str, str]:
+        """
+        Export each dataset to its own file with a pool of threads
+        
+        Args:
+            data: A dictionary of table names to DataFrames
+            output_dir: The directory to write the output to
+            file_suffix: The suffix to add to file names
+            options: The options passed to export; max_workers sets the number
+                of threads, default min(8, number of tables)
+        
+        Returns:
+            A dictionary of table names to output file paths
+        """
+        # Create output directory if it doesn't exist
+        os.makedirs(output_dir, exist_ok=True)
+        
+        # Export the datasets concurrently; pandas, PyArrow and file writes release the GIL
+        result = {}
+        if not data:
+            return result
+        
+        max_workers = options.get("max_workers", min(8, len(data)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for table_name, df in data.items():
+                output_path = os.path.join(output_dir, f"{table_name}{file_suffix}")
+                futures[table_name] = executor.submit(self.export, df, output_path, **options)
+                result[table_name] = output_path
+            
+            # Surface any export error
+            for future in futures.values():
+                future.result()
+        
+        return result
 
 
 
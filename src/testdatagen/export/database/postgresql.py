@@ -1,12 +1,71 @@
 import os
-from typing import Dict, List, Optional, Any, Union
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+from typing import Dict, List, Optional, Any, Union, Callable
 import pandas as pd
 import datetime
+import functools
+import json
 import uuid
 
 from ..base import Exporter
 
 
+# Size of the binary write buffer used for generated SQL scripts
+WRITE_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Characters that must be escaped in PostgreSQL COPY text format
+COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+# dtype predicates, bound once to skip the pd.api.types lookups
+_IS_INT = pd.api.types.is_integer_dtype
+_IS_FLOAT = pd.api.types.is_float_dtype
+_IS_BOOL = pd.api.types.is_bool_dtype
+_IS_NUMERIC = pd.api.types.is_numeric_dtype
+_IS_DT = pd.api.types.is_datetime64_any_dtype
+_IS_STR = pd.api.types.is_string_dtype
+
+
+@functools.lru_cache(maxsize=128)
+def _infer_dtype_column_type(dtype: Any) -> Optional[str]:
+    """
+    Infer a PostgreSQL column type from a pandas dtype alone
+    
+    Returns None for string dtypes, whose values must be inspected.
+    """
+    # Check for numeric types
+    if _IS_INT(dtype):
+        return "INTEGER"
+    elif _IS_FLOAT(dtype):
+        return "NUMERIC"
+    
+    # Check for boolean
+    elif _IS_BOOL(dtype):
+        return "BOOLEAN"
+    
+    # Check for datetime types (naive or timezone-aware, any resolution)
+    elif _IS_DT(dtype):
+        return "TIMESTAMP"
+    
+    # Check for string types
+    elif _IS_STR(dtype):
+        return None
+    
+    # Default to TEXT for unknown types
+    return "TEXT"
+
+
+def _export_table(
+    exporter_class: type,
+    data: pd.DataFrame,
+    output_path: str,
+    options: Dict[str, Any]
+) -> str:
+    """Export a single table from a worker process"""
+    exporter_class().export(data, output_path, **options)
+    return output_path
+
+
 class PostgreSQLExporter(Exporter):
     """Exporter for PostgreSQL database format"""
     
@@ -42,6 +101,7 @@ class PostgreSQLExporter(Exporter):
                 - check_constraints: Dict of constraint names to check expressions
                 - transaction: Whether to wrap in a transaction (default: True)
                 - batch_size: Number of rows per INSERT statement (default: 1000)
+                - use_copy: Whether to load rows with COPY FROM stdin instead of INSERT (default: False)
         """
         # Get options
         table_name = options.get("table_name", "table")
@@ -55,6 +115,7 @@ class PostgreSQLExporter(Exporter):
         check_constraints = options.get("check_constraints", {})
         transaction = options.get("transaction", True)
         batch_size = options.get("batch_size", 1000)
+        use_copy = options.get("use_copy", False)
         
         # Generate SQL
         sql_parts = []
@@ -81,22 +142,29 @@ class PostgreSQLExporter(Exporter):
             )
             sql_parts.append(create_sql)
         
-        # Generate INSERT statements
-        insert_statements = self._generate_insert_statements(
-            data, 
-            table_name, 
-            schema_name, 
-            batch_size
-        )
+        # Generate COPY or INSERT statements
+        if use_copy:
+            insert_statements = self._generate_copy_statements(data, table_name, schema_name)
+        else:
+            insert_statements = self._generate_insert_statements(
+                data, 
+                table_name, 
+                schema_name, 
+                batch_size
+            )
         sql_parts.extend(insert_statements)
         
         # Commit transaction if requested
         if transaction:
             sql_parts.append("COMMIT;")
         
-        # Write to file
-        with open(output_path, "w") as f:
-            f.write("\n\n".join(sql_parts))
+        # Write to file, encoding each statement once into a large binary buffer
+        with open(output_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            write = f.write
+            for i, part in enumerate(sql_parts):
+                if i:
+                    write(b"\n\n")
+                write(part.encode("utf-8"))
     
     def export_all(self, data: Dict[str, pd.DataFrame], output_dir: str, **options) -> Dict[str, str]:
         """
@@ -120,6 +188,8 @@ class PostgreSQLExporter(Exporter):
                 - single_file: Whether to output a single SQL file (default: False)
                 - transaction: Whether to wrap in a transaction (default: True)
                 - batch_size: Number of rows per INSERT statement (default: 1000)
+                - use_copy: Whether to load rows with COPY FROM stdin instead of INSERT (default: False)
+                - max_workers: Number of processes used to export separate files (default: 1)
             
         Returns:
             A dictionary of table names to output file paths
@@ -139,6 +209,8 @@ class PostgreSQLExporter(Exporter):
         single_file = options.get("single_file", False)
         transaction = options.get("transaction", True)
         batch_size = options.get("batch_size", 1000)
+        use_copy = options.get("use_copy", False)
+        max_workers = options.get("max_workers", 1)
         
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
@@ -147,33 +219,33 @@ class PostgreSQLExporter(Exporter):
             # Export all tables to a single file
             output_path = os.path.join(output_dir, f"all_tables{file_suffix}")
             
-            with open(output_path, "w") as f:
+            with open(output_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+                write = f.write
+                
                 # Start transaction if requested
                 if transaction:
-                    f.write("BEGIN;\n\n")
+                    write(b"BEGIN;\n\n")
                 
                 # Drop schema if requested
                 if drop_schema:
-                    f.write(f"DROP SCHEMA IF EXISTS {schema_name} CASCADE;\n\n")
+                    write(f"DROP SCHEMA IF EXISTS {schema_name} CASCADE;\n\n".encode("utf-8"))
                 
                 # Create schema if requested
                 if create_schema:
-                    f.write(f"CREATE SCHEMA IF NOT EXISTS {schema_name};\n\n")
+                    write(f"CREATE SCHEMA IF NOT EXISTS {schema_name};\n\n".encode("utf-8"))
                 
                 # Process each table in dependency order
                 for table_name, df in data.items():
                     # Get table-specific options
-                    table_column_types = {col: column_types.get(f"{table_name}.{col}", None) 
-                                         for col in df.columns}
+                    table_column_types = self._select_table_entries(column_types, table_name, df.columns)
                     table_primary_key = primary_keys.get(table_name, None)
-                    table_foreign_keys = {col: foreign_keys.get(f"{table_name}.{col}", None) 
-                                         for col in df.columns}
+                    table_foreign_keys = self._select_table_entries(foreign_keys, table_name, df.columns)
                     table_unique = unique_constraints.get(table_name, [])
                     table_checks = check_constraints.get(table_name, {})
                     
                     # Drop table if requested
                     if drop_tables:
-                        f.write(f"DROP TABLE IF EXISTS {schema_name}.{table_name};\n\n")
+                        write(f"DROP TABLE IF EXISTS {schema_name}.{table_name};\n\n".encode("utf-8"))
                     
                     # Create table
                     if create_tables:
@@ -187,25 +259,37 @@ class PostgreSQLExporter(Exporter):
                             table_unique, 
                             table_checks
                         )
-                        f.write(create_sql + "\n\n")
+                        write(create_sql.encode("utf-8"))
+                        write(b"\n\n")
                     
-                    # Generate INSERT statements
-                    insert_statements = self._generate_insert_statements(
-                        df, 
-                        table_name, 
-                        schema_name, 
-                        batch_size
-                    )
-                    f.write("\n".join(insert_statements) + "\n\n")
+                    # Generate COPY or INSERT statements
+                    if use_copy:
+                        insert_statements = self._generate_copy_statements(
+                            df, 
+                            table_name, 
+                            schema_name
+                        )
+                    else:
+                        insert_statements = self._generate_insert_statements(
+                            df, 
+                            table_name, 
+                            schema_name, 
+                            batch_size
+                        )
+                    for i, statement in enumerate(insert_statements):
+                        if i:
+                            write(b"\n")
+                        write(statement.encode("utf-8"))
+                    write(b"\n\n")
                 
                 # Commit transaction if requested
                 if transaction:
-                    f.write("COMMIT;\n")
+                    write(b"COMMIT;\n")
             
             return {"all_tables": output_path}
         else:
             # Export each table to a separate file
-            result = {}
+            tasks = []
             for table_name, df in data.items():
                 output_path = os.path.join(output_dir, f"{table_name}{file_suffix}")
                 
@@ -217,17 +301,33 @@ class PostgreSQLExporter(Exporter):
                 table_options["drop_table"] = drop_tables
                 
                 # Extract table-specific constraints
-                table_options["column_types"] = {col: column_types.get(f"{table_name}.{col}", None) 
-                                               for col in df.columns}
+                table_options["column_types"] = self._select_table_entries(column_types, table_name, df.columns)
                 table_options["primary_key"] = primary_keys.get(table_name, None)
-                table_options["foreign_keys"] = {col: foreign_keys.get(f"{table_name}.{col}", None) 
-                                               for col in df.columns}
+                table_options["foreign_keys"] = self._select_table_entries(foreign_keys, table_name, df.columns)
                 table_options["unique_constraints"] = unique_constraints.get(table_name, [])
                 table_options["check_constraints"] = check_constraints.get(table_name, {})
                 
-                # Export table
-                self.export(df, output_path, **table_options)
-                result[table_name] = output_path
+                tasks.append((table_name, df, output_path, table_options))
+            
+            # Tables are independent, so large exports may use worker processes. They are
+            # spawned rather than forked: the caller may be running other threads, and a
+            # forked worker would inherit any lock those threads hold at that moment
+            result = {}
+            if max_workers > 1 and len(tasks) > 1:
+                context = multiprocessing.get_context("spawn")
+                with ProcessPoolExecutor(max_workers=min(max_workers, len(tasks)), mp_context=context) as executor:
+                    futures = {
+                        table_name: executor.submit(
+                            _export_table, type(self), df, output_path, table_options
+                        )
+                        for table_name, df, output_path, table_options in tasks
+                    }
+                    for table_name, future in futures.items():
+                        result[table_name] = future.result()
+            else:
+                for table_name, df, output_path, table_options in tasks:
+                    self.export(df, output_path, **table_options)
+                    result[table_name] = output_path
             
             # If schema creation/dropping is requested, create a separate file for it
             if create_schema or drop_schema:
@@ -249,6 +349,21 @@ class PostgreSQLExporter(Exporter):
             
             return result
     
+    def _select_table_entries(
+        self,
+        entries: Dict[str, Any],
+        table_name: str,
+        columns: pd.Index
+    ) -> Dict[str, Any]:
+        """Select the table.column entries for the columns of one table, keyed by column name"""
+        prefix = f"{table_name}."
+        prefix_length = len(prefix)
+        return {
+            key[prefix_length:]: value
+            for key, value in entries.items()
+            if key.startswith(prefix) and key[prefix_length:] in columns
+        }
+    
     def _generate_create_table(
         self, 
         data: pd.DataFrame, 
@@ -323,86 +438,158 @@ class PostgreSQLExporter(Exporter):
         
         statements = []
         
+        # The column list is the same for every batch, so build the INSERT
+        # preamble once and reuse a single row buffer for all rows
+        columns = ", ".join(data.columns)
+        insert_prefix = f"INSERT INTO {schema_name}.{table_name} ({columns}) VALUES\n"
+        ncols = len(data.columns)
+        value_list = [None] * ncols
+        
+        # Every cell in a column shares its dtype, so pick the formatter once per column
+        col_formatters = [self._pick_formatter(data[col]) for col in data.columns]
+        
         # Process data in batches
         for i in range(0, len(data), batch_size):
             batch = data.iloc[i:i+batch_size]
             
-            # Start INSERT statement
-            columns = ", ".join(batch.columns)
-            sql = f"INSERT INTO {schema_name}.{table_name} ({columns}) VALUES\n"
-            
             # Add values
             values = []
-            for _, row in batch.iterrows():
-                value_list = []
-                for col in batch.columns:
-                    value = row[col]
-                    value_list.append(self._format_value(value))
+            for row in batch.itertuples(index=False, name=None):
+                for j in range(ncols):
+                    value_list[j] = col_formatters[j](row[j])
                 
-                values.append(f"    ({', '.join(value_list)})")
+                values.append("    (" + ", ".join(value_list) + ")")
             
-            sql += ",\n".join(values) + ";"
-            statements.append(sql)
+            statements.append(insert_prefix + ",\n".join(values) + ";")
         
         return statements
     
+    def _generate_copy_statements(
+        self, 
+        data: pd.DataFrame, 
+        table_name: str, 
+        schema_name: str
+    ) -> List[str]:
+        """Generate a COPY FROM stdin block for the data in PostgreSQL text format"""
+        if data.empty:
+            return []
+        
+        # Convert each column to COPY text in one pass, then stitch rows together
+        text_columns = []
+        for col in data.columns:
+            series = data[col]
+            if _IS_BOOL(series.dtype):
+                text = series.map({True: "t", False: "f"})
+            elif _IS_NUMERIC(series.dtype):
+                text = series.astype(str)
+            else:
+                text = series.map(self._format_copy_value)
+            text_columns.append(text.where(series.notna(), "\\N").tolist())
+        
+        columns = ", ".join(data.columns)
+        rows = "\n".join("\t".join(values) for values in zip(*text_columns))
+        return [f"COPY {schema_name}.{table_name} ({columns}) FROM stdin;\n{rows}\n\\."]
+    
     def _infer_column_type(self, series: pd.Series) -> str:
         """Infer PostgreSQL column type from pandas Series"""
+        # Only string columns need their values inspected
+        col_type = _infer_dtype_column_type(series.dtype)
+        if col_type is not None:
+            return col_type
+        
+        # Check if all values are UUIDs
+        if not series.empty and all(self._is_uuid(val) for val in series.dropna()):
+            return "UUID"
+        
+        # Check if all values are JSON
+        if not series.empty and all(self._is_json(val) for val in series.dropna()):
+            return "JSONB"
+        
+        # Default to VARCHAR
+        try:
+            # Try to get max length if all values are strings
+            max_length = series.str.len().max() if not series.empty else 255
+            return f"VARCHAR({max(max_length, 255)})"
+        except (AttributeError, TypeError):
+            # If we can't get string length, use TEXT
+            return "TEXT"
+    
+    def _pick_formatter(self, series: pd.Series) -> Callable[[Any], str]:
+        """Pick the value formatter to use for every cell of a column"""
         dtype = series.dtype
         
-        # Check for numeric types
-        if pd.api.types.is_integer_dtype(dtype):
-            return "INTEGER"
-        elif pd.api.types.is_float_dtype(dtype):
-            return "NUMERIC"
-        
-        # Check for boolean
-        elif pd.api.types.is_bool_dtype(dtype):
-            return "BOOLEAN"
-        
-        # Check for datetime types
-        elif pd.api.types.is_datetime64_dtype(dtype):
-            return "TIMESTAMP"
-        elif pd.api.types.is_datetime64_ns_dtype(dtype):
-            return "TIMESTAMP"
-        
-        # Check for string types
-        elif pd.api.types.is_string_dtype(dtype):
-            # Check if all values are UUIDs
-            if not series.empty and all(self._is_uuid(val) for val in series.dropna()):
-                return "UUID"
-            
-            # Check if all values are JSON
-            if not series.empty and all(self._is_json(val) for val in series.dropna()):
-                return "JSONB"
-            
-            # Default to VARCHAR
-            try:
-                # Try to get max length if all values are strings
-                max_length = series.str.len().max() if not series.empty else 255
-                return f"VARCHAR({max(max_length, 255)})"
-            except (AttributeError, TypeError):
-                # If we can't get string length, use TEXT
-                return "TEXT"
-        
-        # Default to TEXT for unknown types
-        return "TEXT"
+        if _IS_BOOL(dtype):
+            return self._fmt_bool
+        elif _IS_NUMERIC(dtype):
+            return self._fmt_number
+        elif _IS_DT(dtype):
+            return self._fmt_datetime
+        
+        # Object columns may hold anything, so only specialize when the values agree
+        inferred = pd.api.types.infer_dtype(series, skipna=True)
+        if inferred == "string":
+            return self._fmt_string
+        elif inferred == "mixed":
+            value_types = {type(val) for val in series if val is not None}
+            if value_types and value_types <= {dict, list}:
+                return self._fmt_json
+            elif value_types == {uuid.UUID}:
+                return self._fmt_uuid
+        
+        return self._format_value
+    
+    def _fmt_number(self, value: Any) -> str:
+        """Format a numeric value for SQL INSERT statement"""
+        if value is None or pd.isna(value):
+            return "NULL"
+        return str(value)
+    
+    def _fmt_bool(self, value: Any) -> str:
+        """Format a boolean value for SQL INSERT statement"""
+        if value is None or pd.isna(value):
+            return "NULL"
+        return "TRUE" if value else "FALSE"
+    
+    def _fmt_datetime(self, value: Any) -> str:
+        """Format a date or timestamp value for SQL INSERT statement"""
+        if value is None or pd.isna(value):
+            return "NULL"
+        return f"'{value.isoformat()}'"
+    
+    def _fmt_json(self, value: Any) -> str:
+        """Format a dict or list value for SQL INSERT statement"""
+        if not isinstance(value, (dict, list)):
+            return "NULL"
+        return f"'{json.dumps(value, default=str)}'::jsonb"
+    
+    def _fmt_uuid(self, value: Any) -> str:
+        """Format a UUID value for SQL INSERT statement"""
+        if value is None:
+            return "NULL"
+        return f"'{value}'"
+    
+    def _fmt_string(self, value: Any) -> str:
+        """Format a string value for SQL INSERT statement"""
+        if value is None or pd.isna(value):
+            return "NULL"
+        # Escape single quotes for strings
+        escaped_val = value.replace("'", "''")
+        return f"'{escaped_val}'"
     
     def _format_value(self, value: Any) -> str:
         """Format a value for SQL INSERT statement"""
-        if value is None or pd.isna(value):
+        if isinstance(value, (list, dict)):
+            return f"'{json.dumps(value, default=str)}'::jsonb"
+        elif value is None or pd.isna(value):
             return "NULL"
         
-        # Handle different types
-        if isinstance(value, (int, float)):
-            return str(value)
-        elif isinstance(value, bool):
+        # Handle different types (bool before int, since bool is an int subclass)
+        if isinstance(value, bool):
             return "TRUE" if value else "FALSE"
+        elif isinstance(value, (int, float)):
+            return str(value)
         elif isinstance(value, (datetime.date, datetime.datetime)):
             return f"'{value.isoformat()}'"
-        elif isinstance(value, (list, dict)):
-            import json
-            return f"'{json.dumps(value)}'::jsonb"
         elif isinstance(value, uuid.UUID):
             return f"'{str(value)}'"
         else:
@@ -410,6 +597,20 @@ class PostgreSQLExporter(Exporter):
             escaped_val = str(value).replace("'", "''")
             return f"'{escaped_val}'"
     
+    def _format_copy_value(self, value: Any) -> str:
+        """Format a value for a COPY FROM stdin row"""
+        if isinstance(value, bool):
+            return "t" if value else "f"
+        elif isinstance(value, (datetime.date, datetime.datetime)):
+            return value.isoformat()
+        elif isinstance(value, (list, dict)):
+            text = json.dumps(value, default=str)
+        else:
+            text = str(value)
+        
+        # Escape backslashes and row/column delimiters
+        return text.translate(COPY_ESCAPES)
+    
     def _is_uuid(self, value: Any) -> bool:
         """Check if a value is a UUID"""
         if not isinstance(value, str):
@@ -30,11 +30,10 @@
 
 
 
-import os
 from typing import Dict, List, Optional, Any, Union
 import pandas as pd
 
-from ..base import Exporter
+from ..base import Exporter, WRITE_BUFFER_SIZE
 
 
 class CsvExporter(Exporter):
@@ -53,6 +52,9 @@ class CsvExporter(Exporter):
                 - header: Whether to include the header, default True
                 - encoding: The encoding to use, default 'utf-8'
                 - date_format: The format for dates, default None
+                - chunksize: The number of rows to write at a time, default 50000
+                - engine: 'pandas' to use DataFrame.to_csv or 'arrow' to write with PyArrow, default 'pandas';
+                  PyArrow quotes the header and strings, and writes booleans as true/false
         """
         # Get options
         sep = options.get("sep", ",")
@@ -60,16 +62,74 @@ class CsvExporter(Exporter):
         header = options.get("header", True)
         encoding = options.get("encoding", "utf-8")
         date_format = options.get("date_format", None)
+        chunksize = options.get("chunksize", 50_000)
+        engine = options.get("engine", "pandas")
         
-        # Export to CSV
-        data.to_csv(
-            output_path,
-            sep=sep,
-            index=index,
-            header=header,
-            encoding=encoding,
-            date_format=date_format
-        )
+        # PyArrow formats columns in C++; it has no index or date_format support
+        if (
+            engine == "arrow"
+            and not index
+            and date_format is None
+            and encoding.lower().replace("-", "") == "utf8"
+        ):
+            if self._export_arrow(data, output_path, sep, header, chunksize):
+                return
+        
+        # Export to CSV through a large write buffer
+        with open(output_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            data.to_csv(
+                f,
+                sep=sep,
+                index=index,
+                header=header,
+                encoding=encoding,
+                date_format=date_format,
+                chunksize=chunksize
+            )
+    
+    def _export_arrow(
+        self,
+        data: pd.DataFrame,
+        output_path: str,
+        sep: str,
+        header: bool,
+        chunksize: int
+    ) -> bool:
+        """
+        Export data to a CSV file with PyArrow
+        
+        Returns:
+            False if the data has column types PyArrow cannot write as CSV
+        """
+        import pyarrow as pa
+        from pyarrow import csv as pacsv
+        
+        try:
+            table = pa.Table.from_pandas(data, preserve_index=False)
+        except pa.ArrowException:
+            # Mixed or nested object columns
+            return False
+        
+        # Raw bytes would be written unescaped, so leave binary columns to pandas
+        if any(pa.types.is_binary(column_type) for column_type in table.schema.types):
+            return False
+        
+        try:
+            pacsv.write_csv(
+                table,
+                output_path,
+                write_options=pacsv.WriteOptions(
+                    include_header=header,
+                    batch_size=chunksize,
+                    delimiter=sep,
+                    quoting_style="needed"
+                )
+            )
+        except pa.ArrowException:
+            # Nested values such as lists and dicts
+            return False
+        
+        return True
     
     def export_all(self, data: Dict[str, pd.DataFrame], output_dir: str, **options) -> Dict[str, str]:
         """
@@ -80,11 +140,15 @@ class CsvExporter(Exporter):
             output_dir: The directory to write the output to
             **options: Additional options for the exporter
                 - file_suffix: The suffix to add to file names, default '.csv'
+                - max_workers: The number of threads exporting files, default min(8, number of tables)
                 - sep: The separator to use, default ','
                 - index: Whether to include the index, default False
                 - header: Whether to include the header, default True
                 - encoding: The encoding to use, default 'utf-8'
                 - date_format: The format for dates, default None
+                - chunksize: The number of rows to write at a time, default 50000
+                - engine: 'pandas' to use DataFrame.to_csv or 'arrow' to write with PyArrow, default 'pandas';
+                  PyArrow quotes the header and strings, and writes booleans as true/false
             
         Returns:
             A dictionary of table names to output file paths
@@ -92,17 +156,7 @@ class CsvExporter(Exporter):
         # Get options
         file_suffix = options.get("file_suffix", ".csv")
         
-        # Create output directory if it doesn't exist
-        os.makedirs(output_dir, exist_ok=True)
-        
-        # Export each dataset
-        result = {}
-        for table_name, df in data.items():
-            output_path = os.path.join(output_dir, f"{table_name}{file_suffix}")
-            self.export(df, output_path, **options)
-            result[table_name] = output_path
-        
-        return result
+        return self._export_tables_concurrently(data, output_dir, file_suffix, options)
 
 
 
@@ -28,12 +28,37 @@
 
 
 
-import os
 from typing import Dict, List, Optional, Any, Union
 import pandas as pd
 import json
-
-from ..base import Exporter
+import datetime
+import decimal
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from ..base import Exporter, WRITE_BUFFER_SIZE
+
+
+def _orjson_default(value: Any) -> Any:
+    """Convert values orjson cannot serialize natively, the way pandas.to_json does"""
+    if value is pd.NA or value is pd.NaT:
+        return None
+    elif isinstance(value, datetime.datetime):
+        # pandas writes milliseconds, and timezone-aware values in UTC
+        if value.tzinfo is not None:
+            value = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+            return value.isoformat(timespec="milliseconds") + "Z"
+        return value.isoformat(timespec="milliseconds")
+    elif isinstance(value, datetime.date):
+        return f"{value.isoformat()}T00:00:00.000"
+    elif isinstance(value, decimal.Decimal):
+        return str(value)
+    elif isinstance(value, bytes):
+        return value.decode("utf-8")
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
 
 
 class JsonExporter(Exporter):
@@ -43,6 +68,10 @@ class JsonExporter(Exporter):
         """
         Export data to a JSON file
         
+        Records with ISO dates are serialized with orjson when it is installed.
+        orjson writes floats at full precision, while DataFrame.to_json rounds
+        them to 10 decimal places.
+        
         Args:
             data: The data to export
             output_path: The path to write the output to
@@ -51,6 +80,9 @@ class JsonExporter(Exporter):
                 - indent: The indentation level, default 2
                 - date_format: The format for dates, default 'iso'
         """
+        if self._export_orjson(data, output_path, **options):
+            return
+        
         # Get options
         orient = options.get("orient", "records")
         indent = options.get("indent", 2)
@@ -64,8 +96,72 @@ class JsonExporter(Exporter):
         )
         
         # Write to file
-        with open(output_path, "w") as f:
-            f.write(json_data)
+        with open(output_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(json_data.encode("utf-8"))
+    
+    def export_records(self, records: List[Dict[str, Any]], output_path: str, **options) -> None:
+        """
+        Export a list of row dictionaries to a JSON file
+        
+        The rows are serialized with orjson without building a DataFrame when
+        orjson is installed and the options allow it.
+        
+        Args:
+            records: The rows to export
+            output_path: The path to write the output to
+            **options: Additional options for the exporter, as for export
+        """
+        if self._export_orjson(records, output_path, **options):
+            return
+        
+        super().export_records(records, output_path, **options)
+    
+    def _export_orjson(
+        self,
+        data: Union[pd.DataFrame, List[Dict[str, Any]]],
+        output_path: str,
+        **options
+    ) -> bool:
+        """
+        Export a DataFrame or a list of rows with orjson
+        
+        Returns:
+            False if orjson is not installed, the options need pandas or the
+            data holds values orjson cannot serialize
+        """
+        orient = options.get("orient", "records")
+        indent = options.get("indent", 2)
+        date_format = options.get("date_format", "iso")
+        
+        # orjson only supports ISO dates and two-space indentation
+        if orjson is None or orient != "records" or date_format != "iso" or indent not in (0, 2, None):
+            return False
+        
+        records = data.to_dict(orient="records") if isinstance(data, pd.DataFrame) else data
+        json_bytes = self._dump_records(records, indent)
+        if json_bytes is None:
+            return False
+        
+        with open(output_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(json_bytes)
+        return True
+    
+    def _dump_records(self, records: List[Dict[str, Any]], indent: Optional[int]) -> Optional[bytes]:
+        """
+        Serialize records with orjson
+        
+        Returns:
+            None if the records hold values orjson cannot serialize
+        """
+        # Pass dates to _orjson_default, which formats them as pandas does
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        
+        try:
+            return orjson.dumps(records, default=_orjson_default, option=option)
+        except orjson.JSONEncodeError:
+            return None
     
     def export_all(self, data: Dict[str, pd.DataFrame], output_dir: str, **options) -> Dict[str, str]:
         """
@@ -76,6 +172,7 @@ class JsonExporter(Exporter):
             output_dir: The directory to write the output to
             **options: Additional options for the exporter
                 - file_suffix: The suffix to add to file names, default '.json'
+                - max_workers: The number of threads exporting files, default min(8, number of tables)
                 - orient: The format of the JSON string, default 'records'
                 - indent: The indentation level, default 2
                 - date_format: The format for dates, default 'iso'
@@ -86,17 +183,7 @@ class JsonExporter(Exporter):
         # Get options
         file_suffix = options.get("file_suffix", ".json")
         
-        # Create output directory if it doesn't exist
-        os.makedirs(output_dir, exist_ok=True)
-        
-        # Export each dataset
-        result = {}
-        for table_name, df in data.items():
-            output_path = os.path.join(output_dir, f"{table_name}{file_suffix}")
-            self.export(df, output_path, **options)
-            result[table_name] = output_path
-        
-        return result
+        return self._export_tables_concurrently(data, output_dir, file_suffix, options)
 
 
 
@@ -0,0 +1,82 @@
+import json
+from typing import Dict, Any
+import pandas as pd
+
+from ..base import Exporter
+
+
+class ParquetExporter(Exporter):
+    """Exporter for Parquet format"""
+    
+    def export(self, data: pd.DataFrame, output_path: str, **options) -> None:
+        """
+        Export data to a Parquet file
+        
+        Args:
+            data: The data to export
+            output_path: The path to write the output to
+            **options: Additional options for the exporter
+                - index: Whether to include the index, default False
+                - compression: The compression codec to use, default 'zstd'
+                - row_group_size: The maximum number of rows per row group, default 64000
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        # Get options
+        index = options.get("index", False)
+        compression = options.get("compression", "zstd")
+        row_group_size = options.get("row_group_size", 64_000)
+        
+        # Write each column as one contiguous chunk
+        table = pa.Table.from_pandas(self._serialize_nested(data), preserve_index=index).combine_chunks()
+        
+        pq.write_table(
+            table,
+            output_path,
+            compression=compression,
+            row_group_size=row_group_size
+        )
+    
+    def _serialize_nested(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Replace dicts and lists in object columns with JSON strings
+        
+        PyArrow would infer one struct type from every key in a column of dicts,
+        or fail on values it cannot type, so nested values are stored as JSON text.
+        """
+        nested = [
+            name for name, column in data.items()
+            if column.dtype == object and column.map(lambda value: isinstance(value, (dict, list))).any()
+        ]
+        if not nested:
+            return data
+        
+        data = data.copy(deep=False)
+        for name in nested:
+            data[name] = data[name].map(
+                lambda value: json.dumps(value, default=str) if isinstance(value, (dict, list)) else value
+            )
+        return data
+    
+    def export_all(self, data: Dict[str, pd.DataFrame], output_dir: str, **options) -> Dict[str, str]:
+        """
+        Export multiple datasets to Parquet files
+        
+        Args:
+            data: A dictionary of table names to DataFrames
+            output_dir: The directory to write the output to
+            **options: Additional options for the exporter
+                - file_suffix: The suffix to add to file names, default '.parquet'
+                - max_workers: The number of threads exporting files, default min(8, number of tables)
+                - index: Whether to include the index, default False
+                - compression: The compression codec to use, default 'zstd'
+                - row_group_size: The maximum number of rows per row group, default 64000
+        
+        Returns:
+            A dictionary of table names to output file paths
+        """
+        # Get options
+        file_suffix = options.get("file_suffix", ".parquet")
+        
+        return self._export_tables_concurrently(data, output_dir, file_suffix, options)
@@ -15,6 +15,7 @@
 
 
 from typing import Dict, List, Optional, Any, Union
+from collections import deque
 from pydantic import BaseModel
 import pandas as pd
 
@@ -80,6 +81,8 @@ class GenerationEngine:
                 stats["tables"][table.name] = table_stats
                 stats["total_records"] += table_stats.get("record_count", 0)
                 stats["generation_time_ms"] += table_stats.get("generation_time_ms", 0)
+                # Strategies may report DataFrame assembly separately
+                stats["generation_time_ms"] += table_stats.get("frame_build_time_ms", 0)
             
             return GenerationResult(
                 data=data,
@@ -99,47 +102,41 @@ class GenerationEngine:
         Determine the order in which tables should be generated
         based on foreign key dependencies
         """
-        # Build dependency graph
-        dependencies = {}
-        for table in schema.tables:
-            dependencies[table.name] = set()
-            
-            # Check table constraints for foreign keys
-            for constraint in table.constraints:
-                if constraint.constraint_type == "foreign_key":
-                    target_table = constraint.parameters.get("target_table")
-                    if target_table:
-                        dependencies[table.name].add(target_table)
+        tables_by_name = {table.name: table for table in schema.tables}
+        
+        # Collect foreign key dependency edges in a single pass
+        edges = [
+            (table.name, constraint.parameters["target_table"])
+            for table in schema.tables
+            for constraint in table.constraints
+            if constraint.constraint_type == "foreign_key"
+            and constraint.parameters.get("target_table") in tables_by_name
+        ]
+        
+        # Build dependency graph: in-degree per table and the tables depending on it
+        in_degree = {table.name: 0 for table in schema.tables}
+        dependents = {table.name: [] for table in schema.tables}
+        for table_name, target_table in edges:
+            dependents[target_table].append(table_name)
+            in_degree[table_name] += 1
         
-        # Topological sort
-        visited = set()
-        temp_visited = set()
+        # Topological sort (Kahn's algorithm)
+        ready = deque(name for name, degree in in_degree.items() if degree == 0)
         order = []
         
-        def visit(table_name):
-            if table_name in temp_visited:
-                # Cyclic dependency
-                raise ValueError(f"Cyclic dependency detected involving table {table_name}")
+        while ready:
+            table_name = ready.popleft()
+            order.append(tables_by_name[table_name])
             
-            if table_name not in visited:
-                temp_visited.add(table_name)
-                
-                # Visit dependencies
-                for dep in dependencies.get(table_name, set()):
-                    visit(dep)
-                
-                temp_visited.remove(table_name)
-                visited.add(table_name)
-                
-                # Add to order
-                table = next((t for t in schema.tables if t.name == table_name), None)
-                if table:
-                    order.append(table)
+            for dependent in dependents[table_name]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    ready.append(dependent)
         
-        # Visit all tables
-        for table in schema.tables:
-            if table.name not in visited:
-                visit(table.name)
+        if len(order) < len(tables_by_name):
+            # Cyclic dependency
+            table_name = next(name for name, degree in in_degree.items() if degree > 0)
+            raise ValueError(f"Cyclic dependency detected involving table {table_name}")
         
         return order
 
@@ -19,6 +19,7 @@
 from typing import Dict, List, Optional, Any, Union, Tuple
 from abc import ABC, abstractmethod
 import time
+import numpy as np
 import pandas as pd
 
 from ...core.ast.nodes import SchemaNode, TableNode, FieldNode
@@ -31,12 +32,21 @@ class GenerationStrategy(ABC):
         self.schema = None
         self.options = None
         self.context = {}
+        self._table_index = {}
+        self._field_index = {}
     
     def initialize(self, schema: SchemaNode, options: Any) -> None:
         """Initialize the strategy with a schema and options"""
         self.schema = schema
         self.options = options
         self.context = {}
+        
+        # Index tables and fields by name for constant-time lookups
+        self._table_index = {table.name: table for table in schema.tables}
+        self._field_index = {
+            table.name: {field.name: field for field in table.fields}
+            for table in schema.tables
+        }
     
     @abstractmethod
     def generate_table(self, table: TableNode, options: Any) -> Tuple[pd.DataFrame, Dict[str, Any]]:
@@ -70,23 +80,46 @@ class GenerationStrategy(ABC):
     
     def get_table_by_name(self, table_name: str) -> Optional[TableNode]:
         """Get a table by name"""
-        if not self.schema:
-            return None
-            
-        for table in self.schema.tables:
-            if table.name == table_name:
-                return table
-                
-        return None
+        return self._table_index.get(table_name)
     
     def get_field_by_name(self, table: TableNode, field_name: str) -> Optional[FieldNode]:
         """Get a field by name"""
+        fields = self._field_index.get(table.name)
+        if fields is not None and self._table_index.get(table.name) is table:
+            return fields.get(field_name)
+        
+        # Table is not part of the initialized schema
         for field in table.fields:
             if field.name == field_name:
                 return field
                 
         return None
     
+    def apply_null_mask(
+        self,
+        values: np.ndarray,
+        null_mask: np.ndarray
+    ) -> Union[np.ndarray, pd.api.extensions.ExtensionArray]:
+        """
+        Set the masked entries of a generated column to null
+        
+        Args:
+            values: The generated column values
+            null_mask: Boolean array, True where the value should be null
+            
+        Returns:
+            The column, using a nullable pandas array for integer and boolean values
+        """
+        if values.dtype.kind in "iu":
+            return pd.arrays.IntegerArray(values, null_mask)
+        elif values.dtype.kind == "b":
+            return pd.arrays.BooleanArray(values, null_mask)
+        elif values.dtype.kind == "f":
+            values[null_mask] = np.nan
+        else:
+            values[null_mask] = None
+        return values
+    
     def measure_execution_time(self, func, *args, **kwargs) -> Tuple[Any, float]:
         """
         Measure the execution time of a function
@@ -98,10 +131,10 @@ class GenerationStrategy(ABC):
         Returns:
             A tuple of (function result, execution time in milliseconds)
         """
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         result = func(*args, **kwargs)
-        end_time = time.time()
-        execution_time_ms = (end_time - start_time) * 1000
+        end_time = time.perf_counter_ns()
+        execution_time_ms = (end_time - start_time) / 1_000_000
         return result, execution_time_ms
 
 
@@ -22,133 +22,204 @@
 
 
 from typing import Dict, List, Optional, Any, Union, Tuple, Callable
+import functools
+import numpy as np
 import pandas as pd
 from faker import Faker
 
 from ...core.ast.nodes import SchemaNode, TableNode, FieldNode
 from .base import GenerationStrategy
+from ._numeric_kernels import column_seed, gen_int, gen_float
+
+
+@functools.lru_cache(maxsize=16)
+def _get_faker(locale: str) -> Faker:
+    """Get a Faker instance for a locale, loading its providers only once"""
+    return Faker(locale)
+
+
+def _generate_none() -> None:
+    """Generator for fields of unknown type"""
+    return None
 
 
 class FakerStrategy(GenerationStrategy):
     """Strategy for generating data using Faker"""
     
+    # Faker method behind each data type or field name, given as a method name
+    # or as a (method name, args, kwargs) tuple
+    _TYPE_FACTORY = {
+        # Basic types
+        "integer": ("random_int", (), {"min": -1000000, "max": 1000000}),
+        "decimal": ("pyfloat", (), {"min_value": -1000000, "max_value": 1000000}),
+        "string": ("text", (), {"max_nb_chars": 50}),
+        "boolean": "boolean",
+        "date": "date",
+        "binary": ("binary", (), {"length": 64}),
+        "uuid": "uuid4",
+        
+        # Common field names
+        "name": "name",
+        "first_name": "first_name",
+        "last_name": "last_name",
+        "full_name": "name",
+        "email": "email",
+        "phone": "phone_number",
+        "phone_number": "phone_number",
+        "address": "address",
+        "street": "street_address",
+        "city": "city",
+        "state": "state",
+        "zip": "zipcode",
+        "zip_code": "zipcode",
+        "postal_code": "postcode",
+        "country": "country",
+        "company": "company",
+        "company_name": "company",
+        "job": "job",
+        "job_title": "job",
+        "username": "user_name",
+        "password": "password",
+        "url": "url",
+        "uri": "uri",
+        "image": "image_url",
+        "image_url": "image_url",
+        "color": "color_name",
+        "product": "catch_phrase",
+        "product_name": "catch_phrase",
+        "price": ("pydecimal", (), {"min_value": 1, "max_value": 1000, "right_digits": 2}),
+        "description": "paragraph",
+        "summary": ("text", (), {"max_nb_chars": 100}),
+        "title": "sentence",
+        "content": ("paragraphs", (), {"nb": 3}),
+        "comment": "text",
+        "rating": ("random_int", (), {"min": 1, "max": 5}),
+        "ip": "ipv4",
+        "ipv4": "ipv4",
+        "ipv6": "ipv6",
+        "mac_address": "mac_address",
+        "user_agent": "user_agent",
+        "ssn": "ssn",
+        "credit_card": "credit_card_number",
+        "credit_card_number": "credit_card_number",
+        "credit_card_provider": "credit_card_provider",
+        "credit_card_expire": "credit_card_expire",
+        "iban": "iban",
+        "bic": "swift",
+        "bank_account": "bban",
+        "currency": "currency_code",
+        "currency_code": "currency_code",
+        "currency_name": "currency_name",
+        "language": "language_code",
+        "language_code": "language_code",
+        "language_name": "language_name",
+        "locale": "locale",
+        "country_code": "country_code",
+        "file_name": "file_name",
+        "file_path": "file_path",
+        "mime_type": "mime_type",
+        "file_extension": "file_extension",
+        "isbn": "isbn13",
+        "isbn10": "isbn10",
+        "isbn13": "isbn13",
+    }
+    
     def __init__(self):
         super().__init__()
         self.faker = None
         self.type_mapping = {}
-        self._initialize_type_mapping()
+        self.bulk_type_mapping = {}
+        self._np_rng = np.random.default_rng()
+        self._array_generators = {}
+        self._field_generators = {}
+        self._initialize_bulk_type_mapping()
     
     def initialize(self, schema: SchemaNode, options: Any) -> None:
         """Initialize the strategy with a schema and options"""
         super().initialize(schema, options)
         
         # Initialize Faker with locale
-        locale = options.locale if hasattr(options, 'locale') else "en_US"
-        self.faker = Faker(locale)
+        self.faker = _get_faker(options.locale)
+        self._array_generators = {}
         
-        # Set random seed if provided
-        if hasattr(options, 'seed') and options.seed is not None:
+        # Set random seed if provided; Faker.seed reseeds the shared random instance
+        if options.seed is not None:
             Faker.seed(options.seed)
+            self._np_rng = np.random.default_rng(options.seed)
+        else:
+            self._np_rng = np.random.default_rng()
+        
+        self._bind_type_mapping()
+        
+        # Resolve every schema field's generator once, keyed by field identity
+        self._field_generators = {
+            id(field): self._compile_field_generator(field)
+            for table in schema.tables
+            for field in table.fields
+        }
     
-    def _initialize_type_mapping(self) -> None:
-        """Initialize the mapping of data types to Faker providers"""
-        self.type_mapping = {
-            # Basic types
-            "integer": lambda f, _: f.random_int(min=-1000000, max=1000000),
-            "decimal": lambda f, _: f.pyfloat(min_value=-1000000, max_value=1000000),
-            "string": lambda f, _: f.text(max_nb_chars=50),
-            "boolean": lambda f, _: f.boolean(),
-            "date": lambda f, _: f.date(),
-            "timestamp": lambda f, _: f.date_time().isoformat(),
-            "binary": lambda f, _: f.binary(length=64),
-            "uuid": lambda f, _: f.uuid4(),
-            "json": lambda f, _: {"data": f.pydict(nb_elements=5)},
-            
-            # Common field names
-            "name": lambda f, _: f.name(),
-            "first_name": lambda f, _: f.first_name(),
-            "last_name": lambda f, _: f.last_name(),
-            "full_name": lambda f, _: f.name(),
-            "email": lambda f, _: f.email(),
-            "phone": lambda f, _: f.phone_number(),
-            "phone_number": lambda f, _: f.phone_number(),
-            "address": lambda f, _: f.address(),
-            "street": lambda f, _: f.street_address(),
-            "city": lambda f, _: f.city(),
-            "state": lambda f, _: f.state(),
-            "zip": lambda f, _: f.zipcode(),
-            "zip_code": lambda f, _: f.zipcode(),
-            "postal_code": lambda f, _: f.postcode(),
-            "country": lambda f, _: f.country(),
-            "company": lambda f, _: f.company(),
-            "company_name": lambda f, _: f.company(),
-            "job": lambda f, _: f.job(),
-            "job_title": lambda f, _: f.job(),
-            "username": lambda f, _: f.user_name(),
-            "password": lambda f, _: f.password(),
-            "url": lambda f, _: f.url(),
-            "uri": lambda f, _: f.uri(),
-            "image": lambda f, _: f.image_url(),
-            "image_url": lambda f, _: f.image_url(),
-            "color": lambda f, _: f.color_name(),
-            "product": lambda f, _: f.catch_phrase(),
-            "product_name": lambda f, _: f.catch_phrase(),
-            "price": lambda f, _: f.pydecimal(min_value=1, max_value=1000, right_digits=2),
-            "description": lambda f, _: f.paragraph(),
-            "summary": lambda f, _: f.text(max_nb_chars=100),
-            "title": lambda f, _: f.sentence(),
-            "content": lambda f, _: f.paragraphs(nb=3),
-            "comment": lambda f, _: f.text(),
-            "rating": lambda f, _: f.random_int(min=1, max=5),
-            "latitude": lambda f, _: float(f.latitude()),
-            "longitude": lambda f, _: float(f.longitude()),
-            "coordinates": lambda f, _: {"lat": float(f.latitude()), "lng": float(f.longitude())},
-            "ip": lambda f, _: f.ipv4(),
-            "ipv4": lambda f, _: f.ipv4(),
-            "ipv6": lambda f, _: f.ipv6(),
-            "mac_address": lambda f, _: f.mac_address(),
-            "user_agent": lambda f, _: f.user_agent(),
-            "ssn": lambda f, _: f.ssn(),
-            "credit_card": lambda f, _: f.credit_card_number(),
-            "credit_card_number": lambda f, _: f.credit_card_number(),
-            "credit_card_provider": lambda f, _: f.credit_card_provider(),
-            "credit_card_expire": lambda f, _: f.credit_card_expire(),
-            "iban": lambda f, _: f.iban(),
-            "bic": lambda f, _: f.swift(),
-            "bank_account": lambda f, _: f.bban(),
-            "currency": lambda f, _: f.currency_code(),
-            "currency_code": lambda f, _: f.currency_code(),
-            "currency_name": lambda f, _: f.currency_name(),
-            "language": lambda f, _: f.language_code(),
-            "language_code": lambda f, _: f.language_code(),
-            "language_name": lambda f, _: f.language_name(),
-            "locale": lambda f, _: f.locale(),
-            "country_code": lambda f, _: f.country_code(),
-            "file_name": lambda f, _: f.file_name(),
-            "file_path": lambda f, _: f.file_path(),
-            "mime_type": lambda f, _: f.mime_type(),
-            "file_extension": lambda f, _: f.file_extension(),
-            "isbn": lambda f, _: f.isbn13(),
-            "isbn10": lambda f, _: f.isbn10(),
-            "isbn13": lambda f, _: f.isbn13(),
+    def _bind_type_mapping(self) -> None:
+        """Bind the type mapping to the current Faker instance as no-argument generators"""
+        f = self.faker
+        type_mapping = {}
+        for key, spec in self._TYPE_FACTORY.items():
+            if isinstance(spec, str):
+                type_mapping[key] = getattr(f, spec)
+            else:
+                method_name, args, kwargs = spec
+                type_mapping[key] = functools.partial(getattr(f, method_name), *args, **kwargs)
+        
+        # Types whose Faker values need converting
+        type_mapping.update({
+            "timestamp": lambda: f.date_time().isoformat(),
+            "json": lambda: {"data": f.pydict(nb_elements=5)},
+            "latitude": lambda: float(f.latitude()),
+            "longitude": lambda: float(f.longitude()),
+            "coordinates": lambda: {"lat": float(f.latitude()), "lng": float(f.longitude())},
+        })
+        
+        self.type_mapping = type_mapping
+    
+    def _initialize_bulk_type_mapping(self) -> None:
+        """Initialize the mapping of data types to whole-column generators"""
+        # Faker methods that take no arguments fill a column in one tight loop
+        self.bulk_type_mapping = {
+            key: functools.partial(self._bulk_faker_column, spec)
+            for key, spec in self._TYPE_FACTORY.items()
+            if isinstance(spec, str)
         }
+        
+        # Numeric types that can be drawn for a whole column at once, each column
+        # seeded from the strategy's numpy generator
+        self.bulk_type_mapping.update({
+            "integer": lambda rng, n: gen_int(n, -1000000, 1000000, column_seed(rng)),
+            "decimal": lambda rng, n: gen_float(n, -1000000, 1000000, column_seed(rng)),
+            "boolean": lambda rng, n: rng.random(n) < 0.5,
+            "rating": lambda rng, n: gen_int(n, 1, 5, column_seed(rng)),
+            "latitude": lambda rng, n: gen_float(n, -90, 90, column_seed(rng)),
+            "longitude": lambda rng, n: gen_float(n, -180, 180, column_seed(rng)),
+        })
+    
+    def _bulk_faker_column(self, method_name: str, rng: np.random.Generator, n: int) -> np.ndarray:
+        """Generate n values with a Faker method that takes no arguments"""
+        method = getattr(self.faker, method_name)
+        values = np.empty(n, dtype=object)
+        values[:] = [method() for _ in range(n)]
+        return values
     
     def generate_table(self, table: TableNode, options: Any) -> Tuple[pd.DataFrame, Dict[str, Any]]:
         """Generate data for a table"""
         # Get record count
-        record_count = options.record_count if hasattr(options, 'record_count') else 100
-        
-        # Generate data
-        data = []
+        record_count = options.record_count
         
         # Measure execution time
         def generate_data():
-            for i in range(record_count):
-                row = {}
-                for field in table.fields:
-                    row[field.name] = self.generate_field(field, table, i, {})
-                data.append(row)
-            return pd.DataFrame(data)
+            # Generate one column at a time
+            generators = [self._get_field_generator(field) for field in table.fields]
+            columns = {}
+            for field, generator in zip(table.fields, generators):
+                columns[field.name] = self._generate_column(field, generator, record_count)
+            return pd.DataFrame(columns, copy=False)
         
         df, execution_time_ms = self.measure_execution_time(generate_data)
         
@@ -161,32 +232,87 @@ class FakerStrategy(GenerationStrategy):
         
         return df, stats
     
+    def _generate_column(
+        self,
+        field: FieldNode,
+        generator: Callable[[], Any],
+        record_count: int
+    ) -> Union[np.ndarray, pd.api.extensions.ExtensionArray]:
+        """Generate all values of a field for a table"""
+        bulk_generator = self._resolve_bulk_generator(field)
+        
+        if not field.nullable:
+            if bulk_generator:
+                return bulk_generator(self._np_rng, record_count)
+            values = np.empty(record_count, dtype=object)
+            for i in range(record_count):
+                values[i] = generator()
+            return values
+        
+        # Decide which rows are NULL up front (10% chance each) and only
+        # generate values for the rest
+        null_mask = self._np_rng.random(record_count) < 0.1
+        if bulk_generator:
+            non_null_values = bulk_generator(self._np_rng, record_count - int(null_mask.sum()))
+            values = np.empty(record_count, dtype=non_null_values.dtype)
+            values[~null_mask] = non_null_values
+            return self.apply_null_mask(values, null_mask)
+        
+        # Unfilled object slots are already None
+        values = np.empty(record_count, dtype=object)
+        for i in np.flatnonzero(~null_mask):
+            values[i] = generator()
+        return values
+    
+    def _resolve_bulk_generator(self, field: FieldNode) -> Optional[Callable[[Any, int], np.ndarray]]:
+        """Get the whole-column generator for a field, if it has one"""
+        # Generation directives always go through Faker
+        if any(constraint.constraint_type == "generate" for constraint in field.constraints):
+            return None
+        
+        # Use the same name-then-type precedence as _compile_field_generator
+        field_name = field.name.lower()
+        if field_name in self.type_mapping:
+            return self.bulk_type_mapping.get(field_name)
+        return self.bulk_type_mapping.get(field.data_type.lower())
+    
     def generate_field(self, field: FieldNode, table: TableNode, row_index: int, context: Dict[str, Any]) -> Any:
         """Generate a value for a field"""
         # Check if field is nullable and randomly decide to return None
         if field.nullable and self.faker.random_int(min=1, max=10) == 1:  # 10% chance of NULL
             return None
         
+        return self._get_field_generator(field)()
+    
+    def _get_field_generator(self, field: FieldNode) -> Callable[[], Any]:
+        """Get the generator for a field's non-null values, resolved at initialize when possible"""
+        generator = self._field_generators.get(id(field))
+        if generator is None:
+            generator = self._compile_field_generator(field)
+        return generator
+    
+    def _compile_field_generator(self, field: FieldNode) -> Callable[[], Any]:
+        """Resolve the generator for a field's non-null values"""
         # Check for field-specific generation directives
         for constraint in field.constraints:
             if constraint.constraint_type == "generate":
-                return self._handle_generate_directive(constraint, field)
+                return functools.partial(self._handle_generate_directive, constraint, field)
         
         # Try to find a generator based on field name
         field_name = field.name.lower()
         if field_name in self.type_mapping:
-            return self.type_mapping[field_name](self.faker, field)
+            return self.type_mapping[field_name]
         
         # Generate based on data type
         data_type = field.data_type.lower()
         
         if data_type in self.type_mapping:
-            return self.type_mapping[data_type](self.faker, field)
+            return self.type_mapping[data_type]
         elif "[]" in data_type:  # Array type
-            return self._generate_array(field)
+            return functools.partial(self._generate_array, field)
         else:
             # Unknown type, return None
-            return None
+            return _generate_none
     
     def _handle_generate_directive(self, constraint: Any, field: FieldNode) -> Any:
         """Handle a generate directive"""
@@ -231,20 +357,21 @@ class FakerStrategy(GenerationStrategy):
         # Extract base type from array type (e.g., "string[]" -> "string")
         base_type = field.data_type.split("[")[0]
         
-        # Create a temporary field with the base type
-        temp_field = FieldNode(
-            node_type=field.node_type,
-            name=field.name,
-            data_type=base_type,
-            constraints=field.constraints,
-            nullable=field.nullable,
-            line=field.line,
-            column=field.column
-        )
+        # Resolve the element generator once per array field
+        key = (id(field), base_type)
+        generator = self._array_generators.get(key)
+        if generator is None:
+            generator = self._compile_generator_for_type(base_type)
+            self._array_generators[key] = generator
         
         # Generate array elements
         length = self.faker.random_int(min=0, max=5)
-        return [self.generate_field(temp_field, None, i, {}) for i in range(length)]
+        return [generator() for _ in range(length)]
+    
+    def _compile_generator_for_type(self, data_type: str) -> Callable[[], Any]:
+        """Resolve the generator for values of a data type"""
+        # Unknown type, return None
+        return self.type_mapping.get(data_type.lower(), _generate_none)
 
 
 
@@ -18,25 +18,106 @@
 
 
 
-from typing import Dict, List, Optional, Any, Union, Tuple
+from typing import Dict, List, Optional, Any, Union, Tuple, Iterable
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
 import random
 import string
+import time
 import uuid
 import datetime
 import json
 import pandas as pd
 import numpy as np
+import pyarrow as pa
 
-from ...core.ast.nodes import SchemaNode, TableNode, FieldNode
+from ...core.ast.nodes import SchemaNode, TableNode, FieldNode, NodeType
 from .base import GenerationStrategy
+from ._numeric_kernels import column_seed, gen_int, gen_float
+
+
+# Characters used in random strings
+_ALPHABET = string.ascii_letters + string.digits
+
+# Generated dates and timestamps fall between 1970 and 2030
+_DATE_START = datetime.date(1970, 1, 1)
+_DATE_SPAN_DAYS = (datetime.date(2030, 12, 31) - _DATE_START).days
+_TIMESTAMP_START = datetime.datetime(1970, 1, 1, 0, 0, 0)
+_TIMESTAMP_SPAN_SECONDS = int((datetime.datetime(2030, 12, 31, 23, 59, 59) - _TIMESTAMP_START).total_seconds())
+
+# Unconstrained fields for the primitive values inside generated JSON
+_JSON_STRING_FIELD = FieldNode(node_type=NodeType.FIELD, name="value", data_type="string", line=0, column=0)
+_JSON_INTEGER_FIELD = FieldNode(node_type=NodeType.FIELD, name="value", data_type="integer", line=0, column=0)
+_JSON_BOOLEAN_FIELD = FieldNode(node_type=NodeType.FIELD, name="value", data_type="boolean", line=0, column=0)
+_JSON_VALUE_FIELDS = (_JSON_STRING_FIELD, _JSON_INTEGER_FIELD, _JSON_BOOLEAN_FIELD)
+
+
+def _smallest_int_dtype(min_value: int, max_value: int) -> np.dtype:
+    """Get the smallest integer dtype that holds every value in a range"""
+    for dtype in (np.int16, np.int32):
+        info = np.iinfo(dtype)
+        if info.min <= min_value and max_value <= info.max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
+def _generate_shard(
+    strategy_class: type,
+    table: TableNode,
+    record_count: int,
+    seed: int
+) -> pd.DataFrame:
+    """Generate a slice of a table's rows from a worker process"""
+    strategy = strategy_class()
+    strategy._seed(seed)
+    strategy._prepare_fields(table.fields)
+    return pd.DataFrame(strategy._generate_columns(table, record_count), copy=False)
 
 
 class RandomStrategy(GenerationStrategy):
     """Strategy for generating random data"""
     
+    # Byte values of the characters used in random strings
+    ALPHABET = np.frombuffer(_ALPHABET.encode("ascii"), dtype=np.uint8)
+    
+    # Start of generated dates and timestamps, for column generation
+    DATE_START = np.datetime64(_DATE_START, "D")
+    TIMESTAMP_START = np.datetime64(_TIMESTAMP_START, "s")
+    
     def __init__(self):
         super().__init__()
         self.random = random.Random()
+        self._np_rng = np.random.default_rng()
+        self._field_specs = {}
+        self._field_types = {}
+        
+        # Generators of single values by data type
+        self._value_generators = {
+            "integer": self._generate_integer,
+            "decimal": self._generate_decimal,
+            "string": self._generate_string,
+            "boolean": self._generate_boolean,
+            "date": self._generate_date,
+            "timestamp": self._generate_timestamp,
+            "binary": self._generate_binary,
+            "uuid": self._generate_uuid,
+            "json": self._generate_json,
+        }
+        
+        # Types whose values can be drawn for a whole column at once
+        self._column_generators = {
+            "integer": self._generate_integer_column,
+            "decimal": self._generate_decimal_column,
+            "string": self._generate_string_column,
+            "boolean": self._generate_boolean_column,
+            "date": self._generate_date_column,
+            "timestamp": self._generate_timestamp_column,
+            "binary": self._generate_binary_column,
+            "uuid": self._generate_uuid_column,
+            "json": self._generate_json_column,
+        }
+        
+        self._prepare_fields(_JSON_VALUE_FIELDS)
     
     def initialize(self, schema: SchemaNode, options: Any) -> None:
         """Initialize the strategy with a schema and options"""
@@ -44,172 +125,396 @@ class RandomStrategy(GenerationStrategy):
         
         # Set random seed if provided
         if hasattr(options, "seed") and options.seed is not None:
-            self.random.seed(options.seed)
+            self._seed(options.seed)
+        
+        self._field_specs = {}
+        self._field_types = {}
+        self._prepare_fields(_JSON_VALUE_FIELDS)
+        self._prepare_fields(field for table in schema.tables for field in table.fields)
+    
+    def _prepare_fields(self, fields: Iterable[FieldNode]) -> None:
+        """Parse the type and constraints of each field once, keyed by field identity"""
+        for field in fields:
+            self._field_types[id(field)] = self._compile_type(field)
+            self._field_specs[id(field)] = self._compile_spec(field)
+    
+    def _seed(self, seed: int) -> None:
+        """Seed both the scalar random.Random and the numpy generator used for columns"""
+        self.random.seed(seed)
+        self._np_rng = np.random.default_rng(seed)
     
     def generate_table(self, table: TableNode, options: Any) -> Tuple[pd.DataFrame, Dict[str, Any]]:
-        """Generate data for a table"""
-        # Get record count
-        record_count = options.record_count if hasattr(options, "record_count") else 100
+        """
+        Generate data for a table
         
-        # Generate data
-        data = []
+        Args:
+            table: The table to generate data for
+            options: Generation options; strategy_options may contain
+                - parallelism: The number of worker processes generating shards, default 1
+                - shard_size: The number of records per shard of a large table, default 1000000
         
-        # Measure execution time
-        def generate_data():
-            for i in range(record_count):
-                row = {}
-                for field in table.fields:
-                    row[field.name] = self.generate_field(field, table, i, {})
-                data.append(row)
-            return pd.DataFrame(data)
+        Returns:
+            A tuple of the generated data and generation statistics
+        """
+        # Get record count
+        record_count = options.record_count if hasattr(options, "record_count") else 100
+        strategy_options = options.strategy_options if hasattr(options, "strategy_options") else {}
+        parallelism = strategy_options.get("parallelism", 1)
+        shard_size = strategy_options.get("shard_size", 1_000_000)
         
-        df, execution_time_ms = self.measure_execution_time(generate_data)
+        # Time value generation and DataFrame assembly separately
+        start_ns = time.perf_counter_ns()
+        if record_count > shard_size:
+            shards = self._generate_shards(table, record_count, shard_size, parallelism)
+            generated_ns = time.perf_counter_ns()
+            df = pd.concat(shards, ignore_index=True)
+        else:
+            columns = self._generate_columns(table, record_count)
+            generated_ns = time.perf_counter_ns()
+            df = pd.DataFrame(columns, copy=False)
+        built_ns = time.perf_counter_ns()
         
         # Collect statistics
+        generation_time_ms = (generated_ns - start_ns) / 1_000_000
         stats = {
             "record_count": record_count,
-            "generation_time_ms": execution_time_ms,
-            "avg_time_per_record_ms": execution_time_ms / record_count if record_count > 0 else 0
+            "generation_time_ms": generation_time_ms,
+            "frame_build_time_ms": (built_ns - generated_ns) / 1_000_000,
+            "avg_time_per_record_ms": generation_time_ms / record_count if record_count > 0 else 0
         }
         
         return df, stats
     
+    def _generate_columns(
+        self,
+        table: TableNode,
+        record_count: int
+    ) -> Dict[str, Union[np.ndarray, pd.api.extensions.ExtensionArray]]:
+        """Generate the columns of a table"""
+        columns = {}
+        for field in table.fields:
+            columns[field.name] = self._generate_column(field, record_count)
+        return columns
+    
+    def _generate_shards(
+        self,
+        table: TableNode,
+        record_count: int,
+        shard_size: int,
+        parallelism: int
+    ) -> List[pd.DataFrame]:
+        """
+        Generate the rows of a table in fixed-size shards, each with its own seed
+        
+        The shards and their seeds depend only on the record count and shard size,
+        so the result is the same for any number of worker processes.
+        """
+        shard_sizes = [min(shard_size, record_count - start) for start in range(0, record_count, shard_size)]
+        seeds = [column_seed(self._np_rng) for _ in shard_sizes]
+        
+        if parallelism <= 1:
+            return [_generate_shard(type(self), table, size, seed) for size, seed in zip(shard_sizes, seeds)]
+        
+        # Spawn fresh workers; forking after Numba has started its thread pool can deadlock
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=min(parallelism, len(shard_sizes)), mp_context=context) as executor:
+            futures = [
+                executor.submit(_generate_shard, type(self), table, size, seed)
+                for size, seed in zip(shard_sizes, seeds)
+            ]
+            return [future.result() for future in futures]
+    
+    def _generate_column(
+        self,
+        field: FieldNode,
+        record_count: int
+    ) -> Union[np.ndarray, pd.api.extensions.ExtensionArray]:
+        """Generate all values of a field for a table"""
+        data_type, is_array, base_type = self._get_field_type(field)
+        column_generator = self._column_generators.get(data_type)
+        if is_array and base_type in self._column_generators:
+            column_generator = self._generate_array_column
+        
+        # Decide which rows are NULL up front (10% chance each)
+        null_mask = self._np_rng.random(record_count) < 0.1 if field.nullable else None
+        
+        # Other types are generated one value at a time, skipping the NULL rows
+        if column_generator is None:
+            values = np.empty(record_count, dtype=object)
+            rows = range(record_count) if null_mask is None else np.flatnonzero(~null_mask).tolist()
+            for i in rows:
+                values[i] = self._generate_value(field)
+            return values
+        
+        values = column_generator(field, record_count)
+        if null_mask is None:
+            return values
+        return self.apply_null_mask(values, null_mask)
+    
     def generate_field(self, field: FieldNode, table: TableNode, row_index: int, context: Dict[str, Any]) -> Any:
         """Generate a value for a field"""
         # Check if field is nullable and randomly decide to return None
         if field.nullable and self.random.random() < 0.1:  # 10% chance of NULL
             return None
         
+        return self._generate_value(field)
+    
+    def _generate_value(self, field: FieldNode) -> Any:
+        """Generate a non-null value for a field"""
         # Generate based on data type
-        data_type = field.data_type.lower()
+        data_type, is_array, _ = self._get_field_type(field)
+        value_generator = self._value_generators.get(data_type)
         
-        if data_type == "integer":
-            return self._generate_integer(field)
-        elif data_type == "decimal":
-            return self._generate_decimal(field)
-        elif data_type == "string":
-            return self._generate_string(field)
-        elif data_type == "boolean":
-            return self._generate_boolean(field)
-        elif data_type == "date":
-            return self._generate_date(field)
-        elif data_type == "timestamp":
-            return self._generate_timestamp(field)
-        elif data_type == "binary":
-            return self._generate_binary(field)
-        elif data_type == "uuid":
-            return self._generate_uuid(field)
-        elif data_type == "json":
-            return self._generate_json(field)
-        elif "[]" in data_type:  # Array type
+        if value_generator is not None:
+            return value_generator(field)
+        elif is_array:
             return self._generate_array(field)
         else:
             # Unknown type, return None
             return None
     
-    def _generate_integer(self, field: FieldNode) -> int:
-        """Generate a random integer"""
-        # Check for range constraints
-        min_value = -1000000
-        max_value = 1000000
+    def _get_field_type(self, field: FieldNode) -> Tuple[str, bool, str]:
+        """Get a field's parsed data type, compiled at initialize when possible"""
+        field_type = self._field_types.get(id(field))
+        if field_type is None:
+            field_type = self._compile_type(field)
+        return field_type
+    
+    def _compile_type(self, field: FieldNode) -> Tuple[str, bool, str]:
+        """
+        Parse the data type of a field
+        
+        Returns:
+            A tuple of the lowercased data type, whether it is an array type and
+            its base type (e.g., "string[]" -> ("string[]", True, "string"))
+        """
+        data_type = field.data_type.lower()
+        return (data_type, "[]" in data_type, data_type.split("[", 1)[0])
+    
+    def _get_field_spec(self, field: FieldNode) -> Tuple[Any, Any, int, int]:
+        """Get a field's parsed constraints, compiled at initialize when possible"""
+        spec = self._field_specs.get(id(field))
+        if spec is None:
+            spec = self._compile_spec(field)
+        return spec
+    
+    def _compile_spec(self, field: FieldNode) -> Tuple[Any, Any, int, int]:
+        """
+        Parse the range and length constraints of a field
+        
+        Returns:
+            A tuple of (min_value, max_value, min_length, max_length)
+        """
+        if self._get_field_type(field)[2] == "decimal":
+            min_value, max_value = -1000000.0, 1000000.0
+        else:
+            min_value, max_value = -1000000, 1000000
+        min_length = 5
+        max_length = 20
         
-        for constraint in field.constraints:
+        constraints = field.constraints
+        if not constraints:
+            return (min_value, max_value, min_length, max_length)
+        
+        for constraint in constraints:
             if constraint.constraint_type == "range":
                 if "min_value" in constraint.parameters:
                     min_value = constraint.parameters["min_value"]
                 if "max_value" in constraint.parameters:
                     max_value = constraint.parameters["max_value"]
+            elif constraint.constraint_type == "length":
+                if "min_length" in constraint.parameters:
+                    min_length = constraint.parameters["min_length"]
+                if "max_length" in constraint.parameters:
+                    max_length = constraint.parameters["max_length"]
+        
+        return (min_value, max_value, min_length, max_length)
+    
+    def _generate_integer(self, field: FieldNode) -> int:
+        """Generate a random integer"""
+        min_value, max_value, _, _ = self._get_field_spec(field)
         
         return self.random.randint(min_value, max_value)
     
+    def _generate_integer_column(self, field: FieldNode, n: int) -> np.ndarray:
+        """Generate n random integers"""
+        min_value, max_value, _, _ = self._get_field_spec(field)
+        
+        values = gen_int(n, min_value, max_value, column_seed(self._np_rng))
+        
+        # Store the column in the narrowest dtype its range allows
+        return values.astype(_smallest_int_dtype(min_value, max_value), copy=False)
+    
     def _generate_decimal(self, field: FieldNode) -> float:
         """Generate a random decimal"""
-        # Check for range constraints
-        min_value = -1000000.0
-        max_value = 1000000.0
-        
-        for constraint in field.constraints:
-            if constraint.constraint_type == "range":
-                if "min_value" in constraint.parameters:
-                    min_value = constraint.parameters["min_value"]
-                if "max_value" in constraint.parameters:
-                    max_value = constraint.parameters["max_value"]
+        min_value, max_value, _, _ = self._get_field_spec(field)
         
         return min_value + self.random.random() * (max_value - min_value)
     
+    def _generate_decimal_column(self, field: FieldNode, n: int) -> np.ndarray:
+        """Generate n random decimals"""
+        min_value, max_value, _, _ = self._get_field_spec(field)
+        
+        return gen_float(n, min_value, max_value, column_seed(self._np_rng))
+    
     def _generate_string(self, field: FieldNode) -> str:
         """Generate a random string"""
-        # Check for length constraints
-        min_length = 5
-        max_length = 20
-        
-        for constraint in field.constraints:
-            if constraint.constraint_type == "length":
-                if "min_length" in constraint.parameters:
-                    min_length = constraint.parameters["min_length"]
-                if "max_length" in constraint.parameters:
-                    max_length = constraint.parameters["max_length"]
+        _, _, min_length, max_length = self._get_field_spec(field)
         
         # Generate random length
         length = self.random.randint(min_length, max_length)
         
         # Generate random string
-        chars = string.ascii_letters + string.digits
-        return ''.join(self.random.choice(chars) for _ in range(length))
+        return ''.join(self.random.choice(_ALPHABET) for _ in range(length))
+    
+    def _generate_string_column(self, field: FieldNode, n: int) -> pd.arrays.ArrowStringArray:
+        """Generate n random strings as a PyArrow-backed string array"""
+        _, _, min_length, max_length = self._get_field_spec(field)
+        lengths = self._np_rng.integers(min_length, max_length, size=n, endpoint=True)
+        
+        # Sample the characters of every string at once
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        indices = self._np_rng.integers(0, len(self.ALPHABET), size=int(offsets[-1]), dtype=np.uint8)
+        chars = self.ALPHABET[indices]
+        
+        # Use the characters and offsets as Arrow buffers directly, without
+        # creating a Python string per value
+        if offsets[-1] < 2 ** 31:
+            arrow_type, offsets = pa.string(), offsets.astype(np.int32)
+        else:
+            arrow_type = pa.large_string()
+        array = pa.Array.from_buffers(arrow_type, n, [None, pa.py_buffer(offsets), pa.py_buffer(chars)])
+        return pd.arrays.ArrowStringArray(array)
     
     def _generate_boolean(self, field: FieldNode) -> bool:
         """Generate a random boolean"""
-        return self.random.choice([True, False])
+        return self.random.random() < 0.5
+    
+    def _generate_boolean_column(self, field: FieldNode, n: int) -> np.ndarray:
+        """Generate n random booleans"""
+        return self._np_rng.random(n) < 0.5
     
     def _generate_date(self, field: FieldNode) -> str:
         """Generate a random date"""
         # Generate a date between 1970 and 2030
-        start_date = datetime.date(1970, 1, 1)
-        end_date = datetime.date(2030, 12, 31)
-        days_between = (end_date - start_date).days
-        random_days = self.random.randint(0, days_between)
-        random_date = start_date + datetime.timedelta(days=random_days)
+        random_days = self.random.randint(0, _DATE_SPAN_DAYS)
+        random_date = _DATE_START + datetime.timedelta(days=random_days)
         return random_date.isoformat()
     
+    def _generate_date_column(self, field: FieldNode, n: int) -> np.ndarray:
+        """Generate n random dates"""
+        offsets = self._np_rng.integers(0, _DATE_SPAN_DAYS, size=n, endpoint=True)
+        dates = self.DATE_START + offsets.astype("timedelta64[D]")
+        return np.datetime_as_string(dates).astype(object)
+    
     def _generate_timestamp(self, field: FieldNode) -> str:
         """Generate a random timestamp"""
         # Generate a timestamp between 1970 and 2030
-        start_date = datetime.datetime(1970, 1, 1, 0, 0, 0)
-        end_date = datetime.datetime(2030, 12, 31, 23, 59, 59)
-        seconds_between = int((end_date - start_date).total_seconds())
-        random_seconds = self.random.randint(0, seconds_between)
-        random_timestamp = start_date + datetime.timedelta(seconds=random_seconds)
+        random_seconds = self.random.randint(0, _TIMESTAMP_SPAN_SECONDS)
+        random_timestamp = _TIMESTAMP_START + datetime.timedelta(seconds=random_seconds)
         return random_timestamp.isoformat()
     
+    def _generate_timestamp_column(self, field: FieldNode, n: int) -> np.ndarray:
+        """Generate n random timestamps"""
+        offsets = self._np_rng.integers(0, _TIMESTAMP_SPAN_SECONDS, size=n, endpoint=True)
+        timestamps = self.TIMESTAMP_START + offsets.astype("timedelta64[s]")
+        return np.datetime_as_string(timestamps).astype(object)
+    
     def _generate_binary(self, field: FieldNode) -> bytes:
         """Generate random binary data"""
         # Generate random bytes
         length = self.random.randint(10, 100)
-        return bytes(self.random.randint(0, 255) for _ in range(length))
+        return self._np_rng.bytes(length)
+    
+    def _generate_binary_column(self, field: FieldNode, n: int) -> np.ndarray:
+        """Generate n random binary values"""
+        lengths = self._np_rng.integers(10, 100, size=n, endpoint=True)
+        
+        # Draw the bytes of every value at once, then slice them apart
+        ends = np.cumsum(lengths)
+        data = self._np_rng.bytes(int(lengths.sum()))
+        
+        values = np.empty(n, dtype=object)
+        values[:] = [data[end - length:end] for end, length in zip(ends.tolist(), lengths.tolist())]
+        return values
     
     def _generate_uuid(self, field: FieldNode) -> str:
         """Generate a random UUID"""
-        return str(uuid.uuid4())
+        return str(uuid.UUID(bytes=self._np_rng.bytes(16), version=4))
+    
+    def _generate_uuid_column(self, field: FieldNode, n: int) -> np.ndarray:
+        """Generate n random UUIDs"""
+        raw = np.frombuffer(self._np_rng.bytes(16 * n), dtype=np.uint8).reshape(n, 16).copy()
+        
+        # Set the version 4 and RFC 4122 variant bits
+        raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40
+        raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80
+        
+        digits = raw.tobytes().hex()
+        values = np.empty(n, dtype=object)
+        values[:] = [
+            f"{digits[i:i + 8]}-{digits[i + 8:i + 12]}-{digits[i + 12:i + 16]}-{digits[i + 16:i + 20]}-{digits[i + 20:i + 32]}"
+            for i in range(0, 32 * n, 32)
+        ]
+        return values
     
     def _generate_json(self, field: FieldNode) -> Dict[str, Any]:
         """Generate random JSON data"""
         # Generate a simple JSON object
-        keys = [self._generate_string(field) for _ in range(self.random.randint(1, 5))]
+        keys = [self._generate_string(_JSON_STRING_FIELD) for _ in range(self.random.randint(1, 5))]
         values = [
             self.random.choice([
-                self._generate_string(field),
-                self._generate_integer(field),
-                self._generate_boolean(field),
-                [self._generate_string(field) for _ in range(self.random.randint(1, 3))]
+                self._generate_string(_JSON_STRING_FIELD),
+                self._generate_integer(_JSON_INTEGER_FIELD),
+                self._generate_boolean(_JSON_BOOLEAN_FIELD),
+                [self._generate_string(_JSON_STRING_FIELD) for _ in range(self.random.randint(1, 3))]
             ])
             for _ in range(len(keys))
         ]
         return dict(zip(keys, values))
     
+    def _generate_json_column(self, field: FieldNode, n: int) -> np.ndarray:
+        """Generate n random JSON objects"""
+        key_counts = self._np_rng.integers(1, 5, size=n, endpoint=True)
+        total = int(key_counts.sum())
+        
+        # Draw every key, and for every value which kind it is: a string, an
+        # integer, a boolean or a list of strings
+        keys = self._generate_string_column(_JSON_STRING_FIELD, total).tolist()
+        kinds = self._np_rng.integers(0, 4, size=total)
+        
+        # Generate each kind of value as one column, then place them by kind
+        values = [None] * total
+        positions = [np.flatnonzero(kinds == kind).tolist() for kind in range(4)]
+        pools = [
+            self._generate_string_column(_JSON_STRING_FIELD, len(positions[0])).tolist(),
+            self._generate_integer_column(_JSON_INTEGER_FIELD, len(positions[1])).tolist(),
+            self._generate_boolean_column(_JSON_BOOLEAN_FIELD, len(positions[2])).tolist(),
+            self._generate_string_list_column(_JSON_STRING_FIELD, len(positions[3]))
+        ]
+        for kind_positions, pool in zip(positions, pools):
+            for i, value in zip(kind_positions, pool):
+                values[i] = value
+        
+        ends = np.cumsum(key_counts)
+        column = np.empty(n, dtype=object)
+        for i, (end, count) in enumerate(zip(ends.tolist(), key_counts.tolist())):
+            column[i] = dict(zip(keys[end - count:end], values[end - count:end]))
+        return column
+    
+    def _generate_string_list_column(self, field: FieldNode, n: int) -> List[List[str]]:
+        """Generate n lists of one to three random strings"""
+        lengths = self._np_rng.integers(1, 3, size=n, endpoint=True)
+        strings = self._generate_string_column(field, int(lengths.sum())).tolist()
+        
+        ends = np.cumsum(lengths)
+        return [strings[end - length:end] for end, length in zip(ends.tolist(), lengths.tolist())]
+    
     def _generate_array(self, field: FieldNode) -> List[Any]:
         """Generate a random array"""
         # Extract base type from array type (e.g., "string[]" -> "string")
-        base_type = field.data_type.split("[")[0]
+        base_type = self._get_field_type(field)[2]
         
         # Create a temporary field with the base type
         temp_field = FieldNode(
@@ -225,6 +530,24 @@ class RandomStrategy(GenerationStrategy):
         # Generate array elements
         length = self.random.randint(0, 5)
         return [self.generate_field(temp_field, None, i, {}) for i in range(length)]
+    
+    def _generate_array_column(self, field: FieldNode, n: int) -> np.ndarray:
+        """Generate n random arrays of a type that has a column generator"""
+        base_type = self._get_field_type(field)[2]
+        lengths = self._np_rng.integers(0, 5, size=n, endpoint=True)
+        total = int(lengths.sum())
+        
+        # Generate the elements of every array as one column, then slice them apart
+        elements = self._column_generators[base_type](field, total).tolist()
+        if field.nullable:
+            for i in np.flatnonzero(self._np_rng.random(total) < 0.1).tolist():
+                elements[i] = None
+        
+        ends = np.cumsum(lengths)
+        values = np.empty(n, dtype=object)
+        for i, (end, length) in enumerate(zip(ends.tolist(), lengths.tolist())):
+            values[i] = elements[end - length:end]
+        return values
 
 
 
@@ -0,0 +1,244 @@
+import unittest
+import os
+import json
+import tempfile
+import datetime
+from decimal import Decimal
+
+import pandas as pd
+
+from testdatagen.export.database.postgresql import PostgreSQLExporter
+from testdatagen.export.formats.csv_format import CsvExporter
+from testdatagen.export.formats.json_format import JsonExporter, orjson
+from testdatagen.export.formats.parquet_format import ParquetExporter
+
+
+class TestPostgreSQLExporter(unittest.TestCase):
+    """Test the PostgreSQL exporter"""
+
+    def setUp(self):
+        self.exporter = PostgreSQLExporter()
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.output_dir = temp_dir.name
+        self.data = pd.DataFrame({
+            "id": [1, 2],
+            "name": ["O'Brien", None],
+            "active": [True, False]
+        })
+
+    def test_export_insert_statements(self):
+        """Test exporting rows as INSERT statements"""
+        output_path = os.path.join(self.output_dir, "user.sql")
+        self.exporter.export(self.data, output_path, table_name="users")
+
+        with open(output_path) as f:
+            sql = f.read()
+
+        self.assertIn("INSERT INTO public.users (id, name, active) VALUES", sql)
+        self.assertIn("(1, 'O''Brien', TRUE)", sql)
+        self.assertIn("(2, NULL, FALSE)", sql)
+
+    def test_export_copy_block(self):
+        """Test exporting rows as a COPY FROM stdin block"""
+        data = pd.DataFrame({"id": [1, 2], "note": ["a\tb\\c", None]})
+        output_path = os.path.join(self.output_dir, "note.sql")
+        self.exporter.export(data, output_path, table_name="notes", use_copy=True)
+
+        with open(output_path) as f:
+            sql = f.read()
+
+        self.assertNotIn("INSERT INTO", sql)
+        self.assertIn(
+            "COPY public.notes (id, note) FROM stdin;\n1\ta\\tb\\\\c\n2\t\\N\n\\.",
+            sql
+        )
+
+    def test_export_json_values_with_python_types(self):
+        """Test that JSON values holding Decimal and datetime values are exported"""
+        data = pd.DataFrame({
+            "id": [1, 2],
+            "attributes": [
+                {"price": Decimal("9.99"), "seen": datetime.datetime(2020, 1, 1, 10, 0)},
+                None
+            ]
+        })
+        expected = '{"price": "9.99", "seen": "2020-01-01 10:00:00"}'
+
+        copy_path = os.path.join(self.output_dir, "copy.sql")
+        self.exporter.export(data, copy_path, table_name="items", use_copy=True)
+        with open(copy_path) as f:
+            self.assertIn(f"1\t{expected}\n2\t\\N\n", f.read())
+
+        insert_path = os.path.join(self.output_dir, "insert.sql")
+        self.exporter.export(data, insert_path, table_name="items")
+        with open(insert_path) as f:
+            self.assertIn(f"(1, '{expected}'::jsonb)", f.read())
+
+    def test_export_all_skips_keys_for_missing_columns(self):
+        """Test that foreign keys are only written for columns the table has"""
+        data = {"orders": pd.DataFrame({"id": [1], "user_id": [1]})}
+        foreign_keys = {"orders.user_id": ("users", "id"), "orders.coupon_id": ("coupons", "id")}
+        result = self.exporter.export_all(data, self.output_dir, foreign_keys=foreign_keys)
+
+        with open(result["orders"]) as f:
+            sql = f.read()
+
+        self.assertIn("FOREIGN KEY (user_id) REFERENCES public.users(id)", sql)
+        self.assertNotIn("coupon_id", sql)
+
+    def test_export_all_with_worker_processes(self):
+        """Test that worker processes write the same files as a serial export"""
+        data = {
+            f"table_{i}": pd.DataFrame({"id": range(50), "name": [f"row {j}" for j in range(50)]})
+            for i in range(4)
+        }
+        serial_dir = os.path.join(self.output_dir, "serial")
+        parallel_dir = os.path.join(self.output_dir, "parallel")
+        serial = self.exporter.export_all(data, serial_dir, max_workers=1)
+        parallel = self.exporter.export_all(data, parallel_dir, max_workers=3)
+
+        self.assertEqual(
+            {name: os.path.basename(path) for name, path in serial.items()},
+            {name: os.path.basename(path) for name, path in parallel.items()}
+        )
+        for name in serial:
+            with open(serial[name], "rb") as f, open(parallel[name], "rb") as g:
+                self.assertEqual(f.read(), g.read())
+
+
+class TestCsvExporter(unittest.TestCase):
+    """Test the CSV exporter"""
+
+    def setUp(self):
+        self.exporter = CsvExporter()
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.output_dir = temp_dir.name
+
+    def test_default_engine_writes_pandas_dialect(self):
+        """Test that the default engine writes what DataFrame.to_csv writes"""
+        data = pd.DataFrame({
+            "id": [1, 2],
+            "name": ["a", "b,c"],
+            "active": [True, False],
+            "created_at": pd.to_datetime(["2020-01-01 10:00:00", "2020-01-02 11:30:00"])
+        })
+        output_path = os.path.join(self.output_dir, "default.csv")
+        self.exporter.export(data, output_path)
+
+        with open(output_path, "rb") as f:
+            self.assertEqual(
+                f.read(),
+                b'id,name,active,created_at\n'
+                b'1,a,True,2020-01-01 10:00:00\n'
+                b'2,"b,c",False,2020-01-02 11:30:00\n'
+            )
+
+    def test_arrow_engine_writes_arrow_dialect(self):
+        """Test the CSV text written by the arrow engine"""
+        data = pd.DataFrame({"id": [1, 2, 3], "name": ["a", "b,c", None], "active": [True, False, True]})
+        output_path = os.path.join(self.output_dir, "arrow.csv")
+        self.exporter.export(data, output_path, engine="arrow")
+
+        with open(output_path, "rb") as f:
+            self.assertEqual(
+                f.read(),
+                b'"id","name","active"\n1,"a",true\n2,"b,c",false\n3,,true\n'
+            )
+
+    def test_arrow_falls_back_for_nested_values(self):
+        """Test that columns PyArrow cannot write fall back to pandas"""
+        data = pd.DataFrame({"id": [1, 2], "tags": [["a"], []]})
+        output_path = os.path.join(self.output_dir, "tags.csv")
+        self.exporter.export(data, output_path, engine="arrow")
+
+        with open(output_path) as f:
+            self.assertEqual(f.read(), "id,tags\n1,['a']\n2,[]\n")
+
+
+class TestJsonExporter(unittest.TestCase):
+    """Test the JSON exporter"""
+
+    def setUp(self):
+        self.exporter = JsonExporter()
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.output_dir = temp_dir.name
+
+    def test_export_records_matches_export(self):
+        """Test that exporting rows directly matches exporting a DataFrame"""
+        records = [{"id": 1, "name": "a"}, {"id": 2, "name": None}]
+
+        records_path = os.path.join(self.output_dir, "records.json")
+        frame_path = os.path.join(self.output_dir, "frame.json")
+        self.exporter.export_records(records, records_path)
+        self.exporter.export(pd.DataFrame.from_records(records), frame_path)
+
+        for path in (records_path, frame_path):
+            with open(path) as f:
+                self.assertEqual(json.load(f), records)
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_orjson_writes_full_float_precision(self):
+        """Test that orjson writes floats unrounded, unlike DataFrame.to_json"""
+        data = pd.DataFrame({"x": [0.123456789012345, 1e-12]})
+        output_path = os.path.join(self.output_dir, "floats.json")
+        self.exporter.export(data, output_path, indent=0)
+
+        with open(output_path) as f:
+            self.assertEqual(json.load(f), [{"x": 0.123456789012345}, {"x": 1e-12}])
+        self.assertEqual(json.loads(data.to_json(orient="records")), [{"x": 0.123456789}, {"x": 0.0}])
+
+    def test_orjson_dates_match_to_json(self):
+        """Test that dates are written the way DataFrame.to_json writes them"""
+        data = pd.DataFrame({
+            "created_at": pd.to_datetime(["2020-01-01 10:00:00.000000", "2020-01-02 11:30:00.123456", None]),
+            "updated_at": pd.to_datetime(["2020-01-01 10:00:00"] * 3).tz_localize("Europe/Paris"),
+            "born": [datetime.date(1990, 5, 17), None, datetime.date(2000, 1, 1)]
+        })
+        output_path = os.path.join(self.output_dir, "dates.json")
+        self.exporter.export(data, output_path)
+
+        with open(output_path) as f:
+            self.assertEqual(json.load(f), json.loads(data.to_json(orient="records", date_format="iso")))
+
+
+class TestParquetExporter(unittest.TestCase):
+    """Test the Parquet exporter"""
+
+    def setUp(self):
+        self.exporter = ParquetExporter()
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.output_dir = temp_dir.name
+
+    def test_export_all_round_trip(self):
+        """Test that exported tables read back unchanged"""
+        data = {
+            "User": pd.DataFrame({"id": [1, 2], "name": ["a", None]}),
+            "Order": pd.DataFrame({"id": [1], "total": [9.5]})
+        }
+        result = self.exporter.export_all(data, self.output_dir)
+
+        self.assertEqual(result["User"], os.path.join(self.output_dir, "User.parquet"))
+        for table_name, df in data.items():
+            pd.testing.assert_frame_equal(pd.read_parquet(result[table_name]), df)
+
+    def test_export_nested_and_binary_values(self):
+        """Test that JSON values are written as JSON text and binary values as bytes"""
+        output_path = os.path.join(self.output_dir, "doc.parquet")
+        data = pd.DataFrame({
+            "meta": [{"a": 1}, {"b": Decimal("1.5"), "c": [True]}, None],
+            "blob": [b"\x00\xff", b"", None]
+        })
+        self.exporter.export(data, output_path)
+
+        result = pd.read_parquet(output_path)
+        self.assertEqual(result["meta"].tolist()[:2], ['{"a": 1}', '{"b": "1.5", "c": [true]}'])
+        self.assertTrue(pd.isna(result["meta"].iloc[2]))
+        self.assertEqual(result["blob"].tolist(), [b"\x00\xff", b"", None])
+
+
+if __name__ == "__main__":
+    unittest.main()
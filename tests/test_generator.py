@@ -13,8 +13,12 @@
 import unittest
 import os
 from pathlib import Path
+from decimal import Decimal
+
+import pandas as pd
 
 from testdatagen.core.parser import Parser
+from testdatagen.core.ast.nodes import SchemaNode, TableNode, FieldNode, ConstraintNode, NodeType
 from testdatagen.generator.engine import GenerationEngine, GenerationOptions
 from testdatagen.generator.strategies.random_strategy import RandomStrategy
 from testdatagen.generator.strategies.faker_strategy import FakerStrategy
@@ -107,6 +111,163 @@ class TestGenerator(unittest.TestCase):
             if user["email"] is not None:
                 self.assertIn("@", user["email"], f"Email {user['email']} does not look like an email")
 
+    
+    def _make_table(self, name, references=()):
+        """Create a table with an id field and foreign keys to the given tables"""
+        return TableNode(
+            node_type=NodeType.TABLE,
+            name=name,
+            fields=[FieldNode(node_type=NodeType.FIELD, name="id", data_type="integer", line=1, column=1)],
+            constraints=[
+                ConstraintNode(
+                    node_type=NodeType.CONSTRAINT,
+                    name="foreign_key",
+                    constraint_type="foreign_key",
+                    parameters={"target_table": target},
+                    line=1,
+                    column=1
+                )
+                for target in references
+            ],
+            line=1,
+            column=1
+        )
+    
+    def test_generation_order_follows_foreign_keys(self):
+        """Test that referenced tables are generated before the tables referencing them"""
+        schema = SchemaNode(
+            node_type=NodeType.SCHEMA,
+            name="Shop",
+            tables=[
+                self._make_table("OrderItem", ["Order", "Product"]),
+                self._make_table("Order", ["User"]),
+                self._make_table("Product"),
+                self._make_table("User")
+            ],
+            line=1,
+            column=1
+        )
+        
+        order = [table.name for table in self.engine._determine_generation_order(schema)]
+        
+        self.assertEqual(sorted(order), ["Order", "OrderItem", "Product", "User"])
+        self.assertLess(order.index("User"), order.index("Order"))
+        self.assertLess(order.index("Order"), order.index("OrderItem"))
+        self.assertLess(order.index("Product"), order.index("OrderItem"))
+    
+    def test_generation_order_detects_cycles(self):
+        """Test that cyclic foreign keys are reported"""
+        schema = SchemaNode(
+            node_type=NodeType.SCHEMA,
+            name="Cycle",
+            tables=[self._make_table("A", ["B"]), self._make_table("B", ["A"])],
+            line=1,
+            column=1
+        )
+        
+        with self.assertRaises(ValueError):
+            self.engine._determine_generation_order(schema)
+
+    
+    def test_random_strategy_is_reproducible(self):
+        """Test that seeded random generation respects constraints and repeats exactly"""
+        age = FieldNode(
+            node_type=NodeType.FIELD,
+            name="age",
+            data_type="integer",
+            nullable=False,
+            constraints=[
+                ConstraintNode(
+                    node_type=NodeType.CONSTRAINT,
+                    name="range",
+                    constraint_type="range",
+                    parameters={"min_value": 18, "max_value": 65},
+                    line=1,
+                    column=1
+                )
+            ],
+            line=1,
+            column=1
+        )
+        table = self._make_table("User")
+        table.fields += [
+            age,
+            FieldNode(node_type=NodeType.FIELD, name="name", data_type="string", line=1, column=1),
+            FieldNode(node_type=NodeType.FIELD, name="tags", data_type="string[]", line=1, column=1)
+        ]
+        schema = SchemaNode(node_type=NodeType.SCHEMA, name="Users", tables=[table], line=1, column=1)
+        options = GenerationOptions(record_count=200, seed=7, strategy="random")
+        
+        first = self.engine.generate(schema, options)
+        second = self.engine.generate(schema, options)
+        
+        self.assertTrue(first.success, f"Generation failed with errors: {first.errors}")
+        users = first.data["User"]
+        self.assertEqual(len(users), 200)
+        self.assertTrue(users["age"].between(18, 65).all())
+        self.assertTrue(users["name"].isna().any())
+        pd.testing.assert_frame_equal(users, second.data["User"])
+
+    
+    def test_random_strategy_parallel_generation(self):
+        """Test that sharded tables are the same for any number of worker processes"""
+        schema = SchemaNode(
+            node_type=NodeType.SCHEMA,
+            name="Users",
+            tables=[self._make_table("User")],
+            line=1,
+            column=1
+        )
+        
+        results = []
+        for parallelism in (1, 2, 3):
+            options = GenerationOptions(
+                record_count=101,
+                seed=7,
+                strategy="random",
+                strategy_options={"parallelism": parallelism, "shard_size": 40}
+            )
+            result = self.engine.generate(schema, options)
+            self.assertTrue(result.success, f"Generation failed with errors: {result.errors}")
+            results.append(result.data["User"])
+        
+        self.assertEqual(len(results[0]), 101)
+        self.assertEqual(list(results[0].index), list(range(101)))
+        for users in results[1:]:
+            pd.testing.assert_frame_equal(results[0], users)
+
+    
+    def test_faker_strategy_columns(self):
+        """Test the dtypes, generators and reproducibility of Faker columns"""
+        table = self._make_table("Product")
+        table.fields += [
+            FieldNode(node_type=NodeType.FIELD, name="active", data_type="boolean", line=1, column=1),
+            FieldNode(node_type=NodeType.FIELD, name="rating", data_type="string", line=1, column=1),
+            FieldNode(node_type=NodeType.FIELD, name="price", data_type="decimal", line=1, column=1),
+            FieldNode(node_type=NodeType.FIELD, name="email", data_type="string", line=1, column=1)
+        ]
+        schema = SchemaNode(node_type=NodeType.SCHEMA, name="Shop", tables=[table], line=1, column=1)
+        options = GenerationOptions(record_count=200, seed=11, strategy="faker")
+        
+        first = self.engine.generate(schema, options)
+        second = self.engine.generate(schema, options)
+        
+        self.assertTrue(first.success, f"Generation failed with errors: {first.errors}")
+        products = first.data["Product"]
+        self.assertEqual(len(products), 200)
+        
+        # Nullable integers and booleans keep their type alongside NULLs
+        self.assertEqual(products["id"].dtype, "Int64")
+        self.assertEqual(products["active"].dtype, "boolean")
+        self.assertTrue(products["id"].isna().any())
+        
+        # Field names take precedence over data types on the bulk path
+        self.assertTrue(products["rating"].dropna().between(1, 5).all())
+        prices = products["price"].dropna()
+        self.assertTrue(all(isinstance(price, Decimal) and 1 <= price <= 1000 for price in prices))
+        self.assertTrue(all("@" in email for email in products["email"].dropna()))
+        
+        pd.testing.assert_frame_equal(products, second.data["Product"])
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+
+import numpy as np
+
+from testdatagen.generator.strategies import _numeric_kernels
+from testdatagen.generator.strategies._numeric_kernels import (
+    gen_int, gen_float, _gen_int_numpy, _gen_float_numpy
+)
+
+
+class TestNumericKernels(unittest.TestCase):
+    """Test the column kernels of the random strategy"""
+
+    SEEDS = (0, 1, 42, 2 ** 63 - 1)
+
+    def test_values_within_bounds(self):
+        """Test that integers fall in [lo, hi] and floats in [lo, hi)"""
+        for seed in self.SEEDS:
+            for ints in (gen_int(10_000, -5, 5, seed), _gen_int_numpy(10_000, -5, 5, seed)):
+                self.assertEqual(ints.dtype, np.int64)
+                self.assertEqual(set(ints.tolist()), set(range(-5, 6)))
+
+            for floats in (gen_float(10_000, -2.5, 7.5, seed), _gen_float_numpy(10_000, -2.5, 7.5, seed)):
+                self.assertEqual(floats.dtype, np.float64)
+                self.assertTrue(((floats >= -2.5) & (floats < 7.5)).all())
+
+    @unittest.skipIf(_numeric_kernels.numba is None, "numba is not installed")
+    def test_numba_matches_numpy(self):
+        """Test that the Numba kernels produce exactly the numpy kernels' values"""
+        for seed in self.SEEDS:
+            ints = gen_int(1_000, -1_000_000, 1_000_000, seed)
+            np.testing.assert_array_equal(ints, _gen_int_numpy(1_000, -1_000_000, 1_000_000, seed))
+
+            floats = gen_float(1_000, -1.5, 3.0, seed)
+            np.testing.assert_array_equal(floats, _gen_float_numpy(1_000, -1.5, 3.0, seed))
+
+
+if __name__ == "__main__":
+    unittest.main()